@@ -39,7 +39,7 @@ class Home(Singular):
         return name
 
     def __new__(cls, name: str | Home, **kwgs):
-        if isinstance(name, Home):
+        if type(name) is Home:  # Home is final
             return name
         return super().__new__(cls, name=name, **kwgs)
 
@@ -49,9 +49,11 @@ class Home(Singular):
         super().__init__(**kwargs)
         self.set_trait("name", name)
         self.instances: weakref.WeakSet[HasHome] = weakref.WeakSet()
+        # name is read only so the repr can be made once.
+        self._repr = f"<Home: {self.name}>"
 
     def __repr__(self):
-        return f"<Home: {self.name if self.singular_init_started else ''}>"
+        return self.__dict__.get("_repr", "<Home: >")
 
     def __str__(self):
         return self.name
@@ -69,8 +71,8 @@ class Home(Singular):
 
 class _HomeTrait(traitlets.TraitType[Home, Home | str]):
     def _validate(self, obj, value: Home | str):
-        home = Home(value)
-        if obj.trait_has_value("home"):
+        home = value if type(value) is Home else Home(value)
+        if "home" in obj._trait_values:
             msg = "Setting home is prohibited!"
             raise traitlets.TraitError(msg)
         home.instances.add(obj)
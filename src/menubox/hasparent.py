@@ -3,11 +3,10 @@ from __future__ import annotations
 import contextlib
 import functools
 import weakref
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, Self, cast, override
 
 import ipywidgets as ipw
-import pandas as pd
-import toolz
 from async_kernel import Caller
 from ipylab.common import HasApp, Singular
 from traitlets import traitlets
@@ -23,7 +22,7 @@ from menubox.trait_factory import TF
 from menubox.trait_types import ChangeType, NameTuple, ProposalType, R, S, S_co, T, W
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator, Hashable
+    from collections.abc import Generator, Hashable
 
     from async_kernel.pending import Pending
 
@@ -51,6 +50,38 @@ def get_obj_value_tuple(obj: R, func: Callable[[R], Any], /) -> tuple[HasTraits,
     return obj, paths[-1]
 
 
+@functools.lru_cache(maxsize=512)
+def _next_method(cls: type[HasParent], name: str) -> Any | None:
+    """
+    The (unbound) attribute `name` from the first class after `HasParent` in the mro of `cls`.
+
+    Equivalent to `getattr(super(), name, None)` from inside `HasParent` but the mro is only searched once per class.
+    Call `_next_method.cache_clear()` after replacing the attribute on a base class.
+    """
+    mro = cls.__mro__
+    for c in mro[mro.index(HasParent) + 1 :]:
+        if name in c.__dict__:
+            return c.__dict__[name]
+    return None
+
+
+@functools.lru_cache(maxsize=512)
+def _setter_flags(cls: type, name: str) -> tuple[bool, bool, bool, bool]:
+    """
+    The branches of `HasParent.setter` that depend only on the class and attribute name.
+
+    Returns:
+        (is_combobox, is_selection, auto_value, is_trait)
+    """
+    is_value = name == "value"
+    return (
+        is_value and issubclass(cls, ipw.Combobox),
+        is_value and issubclass(cls, ipw.widget_selection._Selection),
+        bool(getattr(cls, "_AUTO_VALUE", False)),
+        issubclass(cls, HasTraits) and name in cls._traits,
+    )
+
+
 class HasParent(Singular, HasApp, Generic[S_co]):
     """
     A base class for objects that have a parent and can manage links to other objects.
@@ -81,16 +112,22 @@ class HasParent(Singular, HasApp, Generic[S_co]):
     single_key: tuple[Hashable, ...]
     _InstanceHP: ClassVar[dict[str, InstanceHP[Self, Any]]] = {}
     _HasParent_init_complete = False
+    _hp_links_batch = 0
+    _hp_links_pending = False
     PROHIBITED_PARENT_LINKS: ClassVar[set[str]] = set()
     _hp_reg_parent_link = TF.Set(klass_=cast("type[set[Link]]", 0))
     _hp_reg_parent_dlink = TF.Set(klass_=cast("type[set[Dlink]]", 0))
     _hasparent_all_links = TF.DictReadOnly(klass_=cast("type[dict[Hashable, Link | Dlink]]", 0))
-    _button_register = TF.DictReadOnly(klass_=cast("type[dict[tuple[str, ipw.Button], Callable]]", 0))
+    _button_register = TF.InstanceHP[Self, weakref.WeakKeyDictionary[ipw.Button, dict[str, Callable]]](
+        klass=weakref.WeakKeyDictionary
+    )
     parent_dlink = NameTuple()
     parent_link = NameTuple()
     name = TF.Str()
     parent: InstanceHP[Any, S_co | None] = TF.parent().configure(TF.IHPMode.X__N)  # pyright: ignore[reportAssignmentType]
     pending = TF.Set(klass_=cast("type[set[Pending[Any]]]", 0))
+    _hp_notifiers: dict[str, tuple[tuple[str | None, Callable], ...]] | None = None
+    _ihp_close_observers: dict[str, dict[str, Any]] | None = None
 
     def __repr__(self):
         if self.closed or not self._HasParent_init_complete:
@@ -119,16 +156,17 @@ class HasParent(Singular, HasApp, Generic[S_co]):
             parent: The parent object.
             **kwargs: Keyword arguments to pass to the super class.
         """
-        if self._HasParent_init_complete:
-            return
         if self.SINGLE_BY:
+            # Only singular instances can be re-initialised (returned from `__new__`).
+            if self._HasParent_init_complete:
+                return
             assert isinstance(self.single_key, tuple)
         if name:
             self.set_trait("name", name)
         values = {}
-        for name in tuple(kwargs):
-            if name in self._InstanceHP:
-                values[name] = kwargs.pop(name)
+        if kwargs and (ihp_names := kwargs.keys() & self._InstanceHP.keys()):
+            # Retain the order the kwargs were passed.
+            values = {n: kwargs.pop(n) for n in tuple(kwargs) if n in ihp_names}
         self._HasParent_init_complete = True
         mb_async.run_async({"pentype": PenType.init}, self.init_async)
         super().__init__(**kwargs)
@@ -148,8 +186,8 @@ class HasParent(Singular, HasApp, Generic[S_co]):
         await super().init_async()
         ```
         """
-        if corofunc := getattr(super(), "init_async", None):
-            await corofunc()
+        if corofunc := _next_method(self.__class__, "init_async"):
+            await corofunc.__get__(self, self.__class__)()
 
     def __init_subclass__(cls, **kwargs) -> None:
         if cls.SINGLE_BY:
@@ -172,15 +210,13 @@ class HasParent(Singular, HasApp, Generic[S_co]):
 
     @classmethod
     def _cls_update_InstanceHP_register(cls: type[HasParent]) -> None:
-        tn_ = dict(cls._InstanceHP)
-        for c in cls.mro():
-            if c is __class__:
-                break
+        tn_ = {}
+        mro = cls.mro()
+        # Merge in reverse so the nearest class in the mro takes precedence.
+        # Need to copy other InstanceHP mappings in case of multiple subclassing
+        for c in reversed(mro[: mro.index(__class__) + 1]):
             if issubclass(c, HasParent) and c._InstanceHP:
-                # Need to copy other InstanceHP mappings in case of multiple subclassing
-                for name in c._InstanceHP:
-                    if name and name not in tn_:
-                        tn_[name] = c._InstanceHP[name]
+                tn_.update(c._InstanceHP)
         cls._InstanceHP = tn_  # pyright: ignore[reportAttributeAccessIssue]
 
     @classmethod
@@ -204,13 +240,13 @@ class HasParent(Singular, HasApp, Generic[S_co]):
         if prohibited := self.PROHIBITED_PARENT_LINKS.intersection(proposal["value"]):
             msg = f"Prohibited links detected: {prohibited}"
             raise NameError(msg)
-        links = []
-        for link in toolz.unique(proposal["value"]):
-            if not self.has_trait(link):
+        links = tuple(dict.fromkeys(proposal["value"]))
+        traits = self._traits
+        for link in links:
+            if link not in traits:
                 msg = f"{self!r} does not have the trait '{link}'"
                 raise AttributeError(msg)
-            links.append(link)
-        return tuple(links)
+        return links
 
     @traitlets.observe("closed")
     def _observe_hasparent_closed(self, _):
@@ -229,20 +265,53 @@ class HasParent(Singular, HasApp, Generic[S_co]):
                     pass
             if isinstance(parent := change["new"], HasParent):
                 self._hp_parent_close_handle = utils.weak_observe(
-                    change["new"], self.close, names="closed", pass_change=False
+                    parent, self._hp_parent_closed, names="closed", pass_change=False
                 )
+        if self._hp_links_batch:
+            self._hp_links_pending = True
+        else:
+            self._hp_update_parent_links()
+
+    @contextlib.contextmanager
+    def batch_links(self):
+        """
+        Context manager to defer updating links to the parent.
+
+        Changes to 'parent', 'parent_link' and 'parent_dlink' made whilst in this context
+        are reconciled once when the (outermost) context is exited.
+        """
+        self._hp_links_batch = self._hp_links_batch + 1
+        try:
+            yield
+        finally:
+            self._hp_links_batch = self._hp_links_batch - 1
+            if not self._hp_links_batch and self._hp_links_pending and not self.closed:
+                self._hp_update_parent_links()
+
+    def _hp_update_parent_links(self) -> None:
+        self._hp_links_pending = False
         p_link = set()
         p_dlink = set()
         if (parent := self.parent) is not None:
+            traits = parent._traits
             for n in self.parent_link:
-                if parent.has_trait(n):
-                    p_link.add((self.parent, n))
+                if n in traits:
+                    p_link.add((parent, n))
             for n in self.parent_dlink:
-                if parent.has_trait(n):
-                    p_dlink.add((self.parent, n))
+                if n in traits:
+                    p_dlink.add((parent, n))
         self.set_trait("_hp_reg_parent_link", p_link)
         self.set_trait("_hp_reg_parent_dlink", p_dlink)
 
+    def _hp_parent_closed(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            # A failure after the object has closed is a benign race; skip reporting it.
+            if self.closed:
+                return
+            raise
+
     @traitlets.observe("_hp_reg_parent_link", "_hp_reg_parent_dlink")
     def _observe__hp_reg_parent_link(self, change: ChangeType):
         # Update links
@@ -276,15 +345,14 @@ class HasParent(Singular, HasApp, Generic[S_co]):
             value: The value to set the attribute to.  Can be of any type, but special
                 handling is provided for strings and ValueTraits.
         """
-        from menubox import valuetraits as vt
-
-        if isinstance(obj, ipw.Combobox) and name == "value":
+        is_combobox, is_selection, auto_value, is_trait = _setter_flags(obj.__class__, name)
+        if is_combobox:
             value = "" if value is None else str(value)
-        if (
-            isinstance(obj, ipw.widget_selection._Selection) and name == "value" and isinstance(value, str)
-        ) and value == "":
+        elif is_selection and isinstance(value, str) and value == "":
             value = None
-        if getattr(obj, "_AUTO_VALUE", False):
+        if auto_value:
+            from menubox import valuetraits as vt
+
             try:
                 val = getattr(obj, name, dv.NO_VALUE)
             except traitlets.TraitError:
@@ -305,7 +373,8 @@ class HasParent(Singular, HasApp, Generic[S_co]):
                     # Support for loading the value back into a HasTraits instance (Widget)
                     obj = val
                     name = "value"
-        if isinstance(obj, HasTraits) and obj.has_trait(name):
+                is_trait = isinstance(obj, HasTraits) and obj.has_trait(name)
+        if is_trait:
             obj.set_trait(name, value)
         else:
             setattr(obj, name, value)
@@ -316,13 +385,18 @@ class HasParent(Singular, HasApp, Generic[S_co]):
         Check objects are equal.
 
         Special handling:
+         - identical objects: always equal
          - dict: checks both order and content are equal
          - DataFrame: uses `equals` method"""
+        if a is b:
+            return True
         try:
             if isinstance(a, dict):
                 return tuple(a) == tuple(b) and (a == b)
             return bool(a == b)
         except ValueError:
+            import pandas as pd
+
             if isinstance(a, pd.DataFrame):
                 return a.equals(b)
         return False
@@ -400,25 +474,51 @@ class HasParent(Singular, HasApp, Generic[S_co]):
         """Reset the trait to an unloaded stated."""
         if callable(name):
             name = utils.parse_object_name(name)
-        if name in self._trait_values:
+        values = self._trait_values
+        if name in values:
             self.log.debug("InstanceHP resetting trait %s", name)
             if self._InstanceHP[name].allow_none:
                 self.set_trait(name, value=None)
-            self._trait_values.pop(name)
+            values.pop(name, None)
+
+    @override
+    def _add_notifiers(self, handler, name, type) -> None:
+        self._hp_notifiers = None
+        super()._add_notifiers(handler, name, type)
+
+    @override
+    def _remove_notifiers(self, handler, name, type) -> None:
+        self._hp_notifiers = None
+        super()._remove_notifiers(handler, name, type)
+
+    @override
+    def unobserve_all(self, name: Any = traitlets.All) -> None:
+        self._hp_notifiers = None
+        super().unobserve_all(name)
 
     def _notify_observers(self, event) -> None:
         """Notify observers of any event"""
         if event["type"] != "change":
             super()._notify_observers(event)
-        elif notifiers := self._trait_notifiers.get(event["name"], {}):
-            for c in (*notifiers.get("change", ()), *notifiers.get("all", ())):
-                try:
-                    if isinstance(c, traitlets.EventHandler) and c.name is not None:
-                        getattr(self, c.name)(event)
-                    else:
-                        c(event)
-                except AttributeError:
-                    pass
+            return
+        name = event["name"]
+        if (cache := self._hp_notifiers) is None:
+            cache = self._hp_notifiers = {}
+        if (callbacks := cache.get(name)) is None:
+            # Flatten the notifiers once, resolving which are event handlers (methods called by name).
+            notifiers = self._trait_notifiers.get(name, {})
+            callbacks = cache[name] = tuple(
+                (c.name if isinstance(c, traitlets.EventHandler) else None, c)
+                for c in (*notifiers.get("change", ()), *notifiers.get("all", ()))
+            )
+        for method_name, c in callbacks:
+            try:
+                if method_name is not None:
+                    getattr(self, method_name)(event)
+                else:
+                    c(event)
+            except AttributeError:
+                pass
 
     def close(self, force=False):
         """
@@ -432,7 +532,9 @@ class HasParent(Singular, HasApp, Generic[S_co]):
         if self.closed or (self.KEEP_ALIVE and not force):
             return
         super().close()
-        self.set_trait("closed", True)
+        self._hp_notifiers = None
+        if not self.closed:
+            self.set_trait("closed", True)
 
     def fstr(self, string: str, raise_errors=False, parameters: dict | None = None) -> str:
         """
@@ -442,7 +544,7 @@ class HasParent(Singular, HasApp, Generic[S_co]):
         """
         if not string:
             return ""
-        g = globals() | {"self": self, "mb": menubox} | (parameters or {})
+        g = {**globals(), "self": self, "mb": menubox, **(parameters or {})}
         try:
             return utils.fstr(string, raise_errors=raise_errors, **g)
         except Exception:
@@ -471,10 +573,15 @@ class HasParent(Singular, HasApp, Generic[S_co]):
         if callable(target):
             target = get_obj_value_tuple(self, target)
         key = key or ("link", target)
-        if current_link := self._hasparent_all_links.pop(key, None):
-            current_link.close()
-        if connect:
-            self._hasparent_all_links[key] = Link(source, target, transform=transform, parent=self)
+        current_link = self._hasparent_all_links.get(key)
+        if connect and type(current_link) is Link and current_link.connects(source, target, transform):
+            # Reuse the link, but re-sync in case the target has since been changed independently.
+            current_link.sync()
+        else:
+            if current_link := self._hasparent_all_links.pop(key, None):
+                current_link.close()
+            if connect:
+                self._hasparent_all_links[key] = Link(source, target, transform=transform, parent=self)
         return None
 
     def dlink(
@@ -498,21 +605,36 @@ class HasParent(Singular, HasApp, Generic[S_co]):
             target = get_obj_value_tuple(self, target)
         self.source, self.target = source, target
         key = key or ("dlink", target)
-        if current_link := self._hasparent_all_links.pop(key, None):
-            current_link.close()
-        if connect:
-            self._hasparent_all_links[key] = Dlink(source, target, transform=transform, parent=self)
+        current_link = self._hasparent_all_links.get(key)
+        if connect and type(current_link) is Dlink and current_link.connects(source, target, transform):
+            # Reuse the link, but re-sync in case the target has since been changed independently.
+            current_link.sync()
+        else:
+            if current_link := self._hasparent_all_links.pop(key, None):
+                current_link.close()
+            if connect:
+                self._hasparent_all_links[key] = Dlink(source, target, transform=transform, parent=self)
 
     def _handle_button_change(self, c: IHPChange[Self, ipw.Button], mode: TF.ButtonMode) -> None:
-        if (b := c["old"]) and (cb := self._button_register.pop((c["name"], b), None)):
-            b.on_click(cb, remove=True)
+        # Buttons are weakly referenced so the register is cleaned if a button is garbage collected.
+        # A button may be assigned to more than one trait, so callbacks are registered by trait name.
+        if (b := c["old"]) and (reg := self._button_register.get(b)) and (on_click := reg.pop(c["name"], None)):
+            b.on_click(on_click, remove=True)
+            if not reg:
+                del self._button_register[b]
         if b := c["new"]:
-            penname = f"button_clicked[{id(b)}] → {self.__class__.__name__}.{c['name']}"
-            self._button_register[(c["name"], b)] = on_click = functools.partial(
-                self._on_click, weakref.ref(self), penname, mode
-            )
+            on_click = functools.partial(self._on_trait_button_click, weakref.ref(self), c["name"], mode)
+            self._button_register.setdefault(b, {})[c["name"]] = on_click
             b.on_click(on_click)
 
+    @classmethod
+    def _on_trait_button_click(
+        cls, ref: weakref.ref[HasParent], name: str, /, mode: TF.ButtonMode, b: ipw.Button
+    ) -> None:
+        # The pending key is only formatted when a click happens.
+        if self_ := ref():
+            cls._on_click(ref, f"button_clicked[{id(b)}] → {self_.__class__.__name__}.{name}", mode, b)
+
     @classmethod
     def _on_click(
         cls,
@@ -557,9 +679,8 @@ class HasParent(Singular, HasApp, Generic[S_co]):
             b (ipw.Button): The button that was clicked.
         """
 
-        button_clicked = getattr(super(), "button_clicked", None)
-        if button_clicked:
-            await button_clicked(b)
+        if button_clicked := _next_method(self.__class__, "button_clicked"):
+            await button_clicked.__get__(self, self.__class__)(b)
 
     async def wait_update_pending(self, timeout=None) -> Self:
         await self.wait_pending(PenType.update, PenType.init, PenType.click, timeout=timeout)
@@ -583,16 +704,16 @@ class HasParent(Singular, HasApp, Generic[S_co]):
         """
 
         if self.pending:
-            pentypes_ = []
+            pentypes_ = set()
             for tt in pentypes or PenType:
                 if not isinstance(tt, PenType):
                     raise TypeError(str(tt))
                 if tt is not PenType.continuous:
-                    pentypes_.append(tt)
+                    pentypes_.add(tt)
             current = Caller.current_pending()
             if pending := [
                 pen
-                for pen in self.pending.copy()
+                for pen in tuple(self.pending)
                 if pen is not current and pen.metadata.get("pentype", PenType.general) in pentypes_
             ]:
                 await Caller().wait(pending, timeout=timeout)
@@ -634,6 +755,10 @@ class HasParent(Singular, HasApp, Generic[S_co]):
         return getattr(self, name, default)
 
 
+# isinstance/issubclass checks with a tuple avoid evaluating `HasParent | ipw.Widget` on each call.
+_HASPARENT_OR_WIDGET = (HasParent, ipw.Widget)
+
+
 class Link(HasParent[S_co]):
     """
     Link traits from different objects together so they remain in sync.
@@ -642,6 +767,9 @@ class Link(HasParent[S_co]):
     """
 
     _updating = False
+    # A transform of `None` passes the value through unchanged.
+    _transform: Callable[[Any], Any] | None = None
+    _transform_inv: Callable[[Any], Any] | None = None
     parent: InstanceHP[Any, S_co] = TF.parent()  # pyright: ignore[reportIncompatibleVariableOverride]
 
     def __init__(
@@ -661,7 +789,7 @@ class Link(HasParent[S_co]):
             self._transform, self._transform_inv = transform
         super().__init__(parent=parent)
         # Synchronise values before observing
-        setattr(target[0], target[1], self._transform(getattr(source[0], source[1])))
+        self.sync()
         source[0].observe(self._update_target, names=source[1])
         if not isinstance(self, Dlink):
             target[0].observe(self._update_source, names=target[1])
@@ -673,20 +801,39 @@ class Link(HasParent[S_co]):
             f"parent={self.parent!r}>"
         )
 
-    def _transform(self, x, /) -> Any:
-        return x
+    def sync(self) -> None:
+        "Set the target from the current source value (observers are not notified if the value is unchanged)."
+        value = getattr(self.source[0], self.source[1])
+        setattr(self.target[0], self.target[1], value if self._transform is None else self._transform(value))
+
+    def connects(
+        self,
+        source: tuple[HasTraits, str],
+        target: tuple[HasTraits, str],
+        transform: tuple[Callable[[Any], Any], Callable[[Any], Any]] | Callable[[Any], Any] | None,
+    ) -> bool:
+        "Returns True if this link is open and already connects `source` to `target` using `transform`."
+        return (
+            not self.closed
+            and self.source[0] is source[0]
+            and self.source[1] == source[1]
+            and self.target[0] is target[0]
+            and self.target[1] == target[1]
+            and self._connects_transform(transform)
+        )
 
-    def _transform_inv(self, x, /) -> Any:
-        return x
+    def _connects_transform(self, transform) -> bool:
+        return (self._transform, self._transform_inv) == tuple(transform or (None, None))
 
     def _update_target(self, change: ChangeType):
-        if self._updating or not self._transform:
-            return
-        if self.closed:
+        if self._updating or self.closed:
             return
         try:
             self._updating = True
-            self.target[0].set_trait(self.target[1], self._transform(change["new"]))
+            new = change["new"]
+            new_target = new if self._transform is None else self._transform(new)
+            # set_trait validates the value and only notifies observers if the validated value changed.
+            self.target[0].set_trait(self.target[1], new_target)
             value = getattr(self.source[0], self.source[1])
             if not self.parent.check_equality(value, change["new"]):
                 msg = f"Broken link {self}: the source value changed while updating the target."
@@ -707,7 +854,9 @@ class Link(HasParent[S_co]):
             return
         try:
             self._updating = True
-            self.source[0].set_trait(self.source[1], self._transform_inv(change["new"]))
+            new = change["new"]
+            new_source = new if self._transform_inv is None else self._transform_inv(new)
+            self.source[0].set_trait(self.source[1], new_source)
             value = getattr(self.target[0], self.target[1])
             if not self.parent.check_equality(value, change["new"]):
                 msg = f"Broken link {self}: the target value changed while updating the source."
@@ -727,10 +876,14 @@ class Link(HasParent[S_co]):
     def close(self, force=True):
         if self.closed:
             return
-        with contextlib.suppress(Exception):
-            self.source[0].unobserve(self._update_target, names=self.source[1])
-        with contextlib.suppress(Exception):
-            self.target[0].unobserve(self._update_source, names=self.target[1])
+        for obj, handler, name in (
+            (self.source[0], self._update_target, self.source[1]),
+            (self.target[0], self._update_source, self.target[1]),
+        ):
+            try:
+                obj.unobserve(handler, names=name)
+            except Exception:
+                pass
         super().close()
 
     @override
@@ -754,3 +907,7 @@ class Dlink(Link):
         if transform:
             self._transform = transform
         super().__init__(source=source, target=target, parent=parent)
+
+    @override
+    def _connects_transform(self, transform) -> bool:
+        return self._transform is transform
@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import contextlib
 import enum
-import inspect
+import functools
 import sys
 import typing
 import weakref
 from collections.abc import Callable
-from types import UnionType
+from types import BuiltinFunctionType, FunctionType, UnionType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -37,7 +37,7 @@ from menubox.defaults import NO_DEFAULT
 from menubox.trait_types import SS, Bunched, P, S, S_co, T
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
     from menubox.children_setter import ChildrenSetter as ChildrenSetterType
     from menubox.css import CSScls
@@ -50,6 +50,27 @@ __all__ = ["InstanceHP", "InstanceHPFactory"]
 ChildrenSetter = cast("type[ChildrenSetterType]", lazy_import("menubox.children_setter", "ChildrenSetter"))
 
 
+# Functions are included because `copy.deepcopy` returns them unchanged.
+_IMMUTABLE_TYPES = (str, int, float, bool, type, type(None), FunctionType, BuiltinFunctionType)
+
+
+def _is_immutable(value: Any) -> bool:
+    "True if `value` is safe to share rather than deep copy (tuples are checked item by item)."
+    if isinstance(value, tuple):
+        return all(_is_immutable(v) for v in value)
+    return isinstance(value, _IMMUTABLE_TYPES)
+
+
+@functools.lru_cache(maxsize=256)
+def _import_klass(name: str) -> type:
+    return import_item(name)
+
+
+@functools.lru_cache(maxsize=128)
+def _css_class_names(add_css_class: str | tuple[str | CSScls, ...]) -> tuple[str, ...]:
+    return tuple(utils.iterflatten(add_css_class))
+
+
 class IHPMode(enum.IntEnum):
     """
     The configured modes for the Instance HP instance.
@@ -156,11 +177,14 @@ class InstanceHP(traitlets.TraitType[T, T], Generic[S, T]):
 
     klass: type[T]
     _default_override = None
+    _finalized = False
     _type = None
     validate = None
     default_value = None
     _change_hooks: ClassVar[dict[str, Callable[[IHPChange], None]]] = {}
-    _close_observers: ClassVar[dict[InstanceHP, weakref.WeakKeyDictionary[mhp.HasParent[Any] | Widget, dict]]] = {}
+    _change_hooks_gen: ClassVar[int] = 0
+    _active_hooks: tuple[Callable[[IHPChange], None], ...] = ()
+    _active_hooks_gen = -1
 
     if TYPE_CHECKING:
         name: str  # pyright: ignore[reportIncompatibleVariableOverride]
@@ -200,7 +224,7 @@ class InstanceHP(traitlets.TraitType[T, T], Generic[S, T]):
                 msg = f"{klass=} must be passed with the full path to the class inside the module"
                 raise ValueError(msg)
             self._klass = klass
-        elif inspect.isclass(klass):
+        elif isinstance(klass, type):
             self._klass = klass
         elif typing.get_origin(klass) in [typing.Union, UnionType]:
             self._type = klass
@@ -317,11 +341,12 @@ class InstanceHP(traitlets.TraitType[T, T], Generic[S, T]):
             old_value = self.default_value
         obj._trait_values[self.name] = new_value
         if not obj.check_equality(old_value, new_value):
-            change = Bunched(name=self.name, old=old_value, new=new_value, owner=obj, type="change", ihp=self)
-            try:
-                self._value_changed(change)  # pyright: ignore[reportArgumentType]
-            except Exception as e:
-                obj.on_error(e, f"Instance configuration error for {self!r}.")
+            if self._hookmappings:
+                change = Bunched(name=self.name, old=old_value, new=new_value, owner=obj, type="change", ihp=self)
+                try:
+                    self._value_changed(change)  # pyright: ignore[reportArgumentType]
+                except Exception as e:
+                    obj.on_error(e, f"Instance configuration error for {self!r}.")
             obj._notify_trait(self.name, old_value, new_value)
 
     def get(self, obj: S, cls: Any = None) -> T | None:  # pyright: ignore[reportIncompatibleMethodOverride]
@@ -331,17 +356,24 @@ class InstanceHP(traitlets.TraitType[T, T], Generic[S, T]):
             # Obtain the default.
             default = self.default(obj)
 
-            # Using a context manager has a large runtime overhead, so we
-            # write out the obj.cross_validation_lock call here.
-            _cross_validation_lock = obj._cross_validation_lock
-            try:
-                obj._cross_validation_lock = True
-                value = self._validate(obj, default)
-            finally:
-                obj._cross_validation_lock = _cross_validation_lock
+            if type(self)._validate is InstanceHP._validate and (
+                (default is None and self.allow_none) or (self.validate is None and type(default) is self._type)
+            ):
+                # Validation under the lock would return these values unchanged (unless a subclass overrides it).
+                value = default
+            else:
+                # Using a context manager has a large runtime overhead, so we
+                # write out the obj.cross_validation_lock call here.
+                _cross_validation_lock = obj._cross_validation_lock
+                try:
+                    obj._cross_validation_lock = True
+                    value = self._validate(obj, default)
+                finally:
+                    obj._cross_validation_lock = _cross_validation_lock
             obj._trait_values[self.name] = value
             dv = self.default_value
-            if not obj.check_equality(value, dv):
+            # Only build the change when a hook or an observer will receive it.
+            if (self._hookmappings or self.name in obj._trait_notifiers) and not obj.check_equality(value, dv):
                 change = Bunched(name=self.name, old=dv, new=value, owner=obj, type="change", ihp=self)
                 self._value_changed(change)  # pyright: ignore[reportArgumentType]
                 obj._notify_observers(change)
@@ -365,14 +397,14 @@ class InstanceHP(traitlets.TraitType[T, T], Generic[S, T]):
             based on whether the class inherits from `HasParent` or `Widget`.
         4.  Sets the `_set_parent` attribute based on the `set_parent` hook mapping.
         """
-        if hasattr(self, "klass"):
+        if self._finalized:
             return self
         m = self._hookmappings
         if self._type:
             self.klass = object  # pyright: ignore[reportAttributeAccessIssue]
         else:
-            klass = self._klass if inspect.isclass(self._klass) else import_item(self._klass)
-            assert inspect.isclass(klass)
+            klass = self._klass if isinstance(self._klass, type) else _import_klass(self._klass)
+            assert isinstance(klass, type)
             self.klass = klass  # pyright: ignore[reportAttributeAccessIssue]
             self._type = klass
             if getattr(klass, "KEEP_ALIVE", False):
@@ -384,9 +416,11 @@ class InstanceHP(traitlets.TraitType[T, T], Generic[S, T]):
                     m["on_replace_close"] = True
             if issubclass(klass, mhp.HasParent) and "set_parent" not in m:
                 m["set_parent"] = True
-            if "remove_on_close" not in m and issubclass(klass, mhp.HasParent | Widget):
+            if "remove_on_close" not in m and issubclass(klass, mhp._HASPARENT_OR_WIDGET):
                 m["remove_on_close"] = True
         self._set_parent = m.get("set_parent", False)
+        self._active_hooks_gen = -1
+        self._finalized = True
         return self
 
     def default(self, owner: S, override: None | dict = None) -> T | None:  # pyright: ignore[reportIncompatibleMethodOverride]
@@ -408,10 +442,13 @@ class InstanceHP(traitlets.TraitType[T, T], Generic[S, T]):
                 if self.allow_none:
                     return None
                 return self.default_value
+            default = self._default_override
+            if not (default or override or self._set_parent):
+                return self.klass()
             kwgs = {"parent": owner} if self._set_parent else {}
             if override:
-                kwgs = kwgs | override
-            if default := self._default_override:
+                kwgs.update(override)
+            if default:
                 return default(IHPCreate(owner=owner, name=self.name, klass=self.klass, kwgs=kwgs))
             return self.klass(**kwgs)
 
@@ -434,16 +471,19 @@ class InstanceHP(traitlets.TraitType[T, T], Generic[S, T]):
         raise ValueError
 
     def _value_changed(self, change: IHPChange[S, T]):
-        if hookmappings := self._hookmappings:
-            for hookname in hookmappings:
-                if hook := self._change_hooks.get(hookname):
-                    try:
-                        hook(change)
-                    except Exception as e:
-                        if "pytest" in sys.modules:
-                            # If debugging import `pytest` to make this repeatable
-                            raise
-                        change["owner"].on_error(e, f"Hook error for {self!r} {hook=}")
+        if self._active_hooks_gen != InstanceHP._change_hooks_gen:
+            # Resolve the hooks once; invalidated by `hooks`, `finalize` and `register_change_hook`.
+            change_hooks = self._change_hooks
+            self._active_hooks = tuple(change_hooks[n] for n in self._hookmappings if n in change_hooks)
+            self._active_hooks_gen = InstanceHP._change_hooks_gen
+        for hook in self._active_hooks:
+            try:
+                hook(change)
+            except Exception as e:
+                if "pytest" in sys.modules:
+                    # If debugging import `pytest` to make this repeatable
+                    raise
+                change["owner"].on_error(e, f"Hook error for {self!r} {hook=}")
 
     def _on_obj_close(self, obj: S):
         if (
@@ -485,67 +525,77 @@ class InstanceHP(traitlets.TraitType[T, T], Generic[S, T]):
                 or if the path isn't available specify as a `(obj, trait_name)` tuple `(obj.sub_object, "trait_name")`.
         """
         if kwgs:
-            merge(self._hookmappings, kwgs, strategy=Strategy.REPLACE)  # pyright: ignore[reportArgumentType]
+            self._update_hookmappings(kwgs)
         return self
 
+    def _update_hookmappings(self, kwgs: Mapping[str, Any]) -> None:
+        """
+        Merge `kwgs` into the hook mappings using a nested replace strategy.
+
+        Values that are safe to share are assigned directly, otherwise `merge` copies them.
+        """
+        if all(_is_immutable(v) for v in kwgs.values()):
+            self._hookmappings.update(kwgs)  # pyright: ignore[reportCallIssue, reportArgumentType]
+        else:
+            merge(self._hookmappings, kwgs, strategy=Strategy.REPLACE)  # pyright: ignore[reportArgumentType]
+        self._active_hooks_gen = -1
+
     @classmethod
     def register_change_hook(cls, name: str, hook: Callable[[IHPChange], None], *, replace=False) -> None:
         if not replace and name in cls._change_hooks:
             msg = f"callback hook {name=} is already registered!"
             raise KeyError(msg)
         cls._change_hooks[name] = hook
+        InstanceHP._change_hooks_gen += 1
 
     @classmethod
-    def _remove_on_close_hook(cls, c: IHPChange[S, T]) -> None:
-        if c["owner"].closed:
+    def unregister_change_hook(cls, name: str) -> Callable[[IHPChange], None]:
+        "Remove and return the change hook registered as `name`."
+        hook = cls._change_hooks.pop(name)
+        InstanceHP._change_hooks_gen += 1
+        return hook
+
+    @staticmethod
+    def _remove_on_close_hook(c: IHPChange[S, T]) -> None:
+        owner = c["owner"]
+        if owner.closed:
             return
-        if c["ihp"] not in cls._close_observers:
-            cls._close_observers[c["ihp"]] = weakref.WeakKeyDictionary()
+        ihp, old, new = c["ihp"], c["old"], c["new"]
+        # The observers are stored on the owner so they share its lifetime.
+        if (observers := owner._ihp_close_observers) is None:
+            observers = owner._ihp_close_observers = {}
         # value closed
-        if (old_observer := cls._close_observers[c["ihp"]].pop(c["owner"], {})) and isinstance(
-            c["old"], mhp.HasParent | Widget
-        ):
+        if (old_observer := observers.pop(ihp.name, None)) and isinstance(old, mhp._HASPARENT_OR_WIDGET):
             try:
-                c["old"].unobserve(**old_observer)
+                old.unobserve(**old_observer)
             except ValueError:
                 pass
 
-        if isinstance(c["new"], mhp.HasParent | Widget):
-            owner_ref = weakref.ref(c["owner"])
-            ihp = c["ihp"]
-
-            def _observe_closed(change: mb.ChangeType) -> None:
-                # If the c["owner"] has closed, remove it from c["owner"] if appropriate.
-                owner = owner_ref()
-                cname, value = change["name"], change["new"]
-                if (
-                    owner
-                    and ihp._hookmappings
-                    and ((cname == "closed" and value) or (cname == "comm" and not value))
-                    and owner._trait_values.get(ihp.name) is change["owner"]
-                ) and (old := owner._trait_values.pop(ihp.name, None)):
-                    change_ = Bunched(
-                        name=ihp.name,
-                        old=old,
-                        new=None,
-                        owner=owner,
-                        type="change",
-                        ihp=ihp,
-                    )
-                    ihp._value_changed(cast("IHPChange", change_))
+        if isinstance(new, mhp._HASPARENT_OR_WIDGET):
+            handler = functools.partial(InstanceHP._observe_value_closed, weakref.ref(owner), ihp)
+            names = "closed" if isinstance(new, mhp.HasParent) else "comm"
+            new.observe(handler, names)
+            observers[ihp.name] = {"handler": handler, "names": names}
 
-            names = "closed" if isinstance(c["new"], mhp.HasParent) else "comm"
-            c["new"].observe(_observe_closed, names)
-            cls._close_observers[c["ihp"]][c["owner"]] = {
-                "handler": _observe_closed,
-                "names": names,
-            }
+    @staticmethod
+    def _observe_value_closed(owner_ref: weakref.ref[mhp.HasParent], ihp: InstanceHP, change: mb.ChangeType) -> None:
+        # If the value has closed, remove it from the owner if appropriate.
+        owner = owner_ref()
+        cname, value = change["name"], change["new"]
+        if (
+            owner
+            and ihp._hookmappings
+            and ((cname == "closed" and value) or (cname == "comm" and not value))
+            and owner._trait_values.get(ihp.name) is change["owner"]
+        ) and (old := owner._trait_values.pop(ihp.name, None)):
+            change_ = Bunched(name=ihp.name, old=old, new=None, owner=owner, type="change", ihp=ihp)
+            ihp._value_changed(cast("IHPChange", change_))
 
     @staticmethod
     def _on_replace_close_hook(c: IHPChange[S, T]) -> None:
         if (
             c["ihp"]._hookmappings.get("on_replace_close")
-            and isinstance(c["old"], Widget | mhp.HasParent)
+            and isinstance(c["old"], mhp._HASPARENT_OR_WIDGET)
             and not getattr(c["old"], "KEEP_ALIVE", False)
         ):
             if mb.DEBUG_ENABLED:
@@ -571,19 +621,22 @@ class InstanceHP(traitlets.TraitType[T, T], Generic[S, T]):
     @staticmethod
     def _add_css_class_hook(c: IHPChange[S, T]) -> None:
         if add_css_class := c["ihp"]._hookmappings.get("add_css_class"):
-            for cn in utils.iterflatten(add_css_class):
-                if isinstance(c["new"], DOMWidget):
-                    c["new"].add_class(cn)
-                if isinstance(c["old"], DOMWidget):
-                    c["old"].remove_class(cn)
+            new, old = c["new"], c["old"]
+            new_is_dom, old_is_dom = isinstance(new, DOMWidget), isinstance(old, DOMWidget)
+            for cn in _css_class_names(add_css_class):
+                if new_is_dom:
+                    new.add_class(cn)
+                if old_is_dom:
+                    old.remove_class(cn)
 
     @staticmethod
     def _set_parent_hook(c: IHPChange[S, T]) -> None:
-        if (not c["owner"].closed) and c["ihp"]._hookmappings.get("set_parent"):
-            if isinstance(c["old"], mhp.HasParent) and getattr(c["old"], "parent", None) is c["owner"]:
-                c["old"].parent = None
-            if isinstance(c["new"], mhp.HasParent) and not c["owner"].closed:
-                c["new"].parent = c["owner"]
+        owner = c["owner"]
+        if (not owner.closed) and c["ihp"]._hookmappings.get("set_parent"):
+            if isinstance(old := c["old"], mhp.HasParent) and getattr(old, "parent", None) is owner:
+                old.parent = None
+            if isinstance(new := c["new"], mhp.HasParent) and not owner.closed:
+                new.parent = owner
 
     @staticmethod
     def _set_children_hook(c: IHPChange[S, T]) -> None:
@@ -677,12 +730,17 @@ class InstanceHPFactory(Generic[P, T]):
 
         self.klass = klass
         self.defaults_ = merge({}, defaults) if defaults else {}
+        self._defaults_immutable = all(_is_immutable(v) for v in self.defaults_.values())
         self.tags = dict(tags) if tags else {}
         self.hooks = hooks
 
     def __call__(self, co_: S_co, /, *args: P.args, **kwgs: P.kwargs) -> InstanceHP[S_co, T]:
         if self.defaults_:
-            kwgs = merge({}, self.defaults_, kwgs, strategy=Strategy.REPLACE)  # pyright: ignore[reportAssignmentType]
+            if not kwgs and self._defaults_immutable:
+                # Nothing to merge or protect from mutation; the lambda below copies per instance.
+                kwgs = self.defaults_  # pyright: ignore[reportAssignmentType]
+            else:
+                kwgs = merge({}, self.defaults_, kwgs, strategy=Strategy.REPLACE)  # pyright: ignore[reportAssignmentType]
         instance = InstanceHP(
             self.klass,  # pyright: ignore[reportCallIssue, reportArgumentType]
             lambda c: c["klass"](*args, **kwgs | c["kwgs"]),
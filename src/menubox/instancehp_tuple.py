@@ -14,13 +14,11 @@ from typing import (
     override,
 )
 
-from ipywidgets import Widget
-from mergedeep import Strategy, merge
 from traitlets.traitlets import TraitType
 
 import menubox as mb
 from menubox import defaults, utils
-from menubox.hasparent import HasParent
+from menubox.hasparent import _HASPARENT_OR_WIDGET, HasParent
 from menubox.instance import IHPChange, IHPCreate, InstanceHP
 from menubox.trait_types import T, V
 from menubox.valuetraits import ValueTraits
@@ -142,7 +140,7 @@ class InstanceHPTuple(InstanceHP[V, tuple[T, ...]], Generic[V, T]):
         super().__init__(klass, default, default_value=default_value, co_=co_)  # pyright: ignore[reportArgumentType]
         self._factory = factory
         self.read_only = read_only
-        self._close_observers: weakref.WeakKeyDictionary[T, (Callable, str)] = (  # pyright: ignore[reportIncompatibleVariableOverride, reportGeneralTypeIssues]
+        self._close_observers: weakref.WeakKeyDictionary[T, (Callable, str)] = (  # pyright: ignore[reportGeneralTypeIssues]
             weakref.WeakKeyDictionary()
         )
 
@@ -274,13 +272,13 @@ class InstanceHPTuple(InstanceHP[V, tuple[T, ...]], Generic[V, T]):
                 from ValueTraits, but have a `value` trait: use the hook `update_by = menubox.defaults.INDEX`.
         """
         if kwgs:
-            merge(self._hookmappings, kwgs, strategy=Strategy.REPLACE)  # pyright: ignore[reportArgumentType]
+            self._update_hookmappings(kwgs)
         return self
 
     def _on_add(self, obj: V, value: T):
         if isinstance(value, HasParent) and self._hookmappings.get("set_parent"):
             value.parent = obj
-        if isinstance(value, HasParent | Widget) and value not in self._close_observers:
+        if isinstance(value, _HASPARENT_OR_WIDGET) and value not in self._close_observers:
             names = "closed" if isinstance(value, HasParent) else "comm"
             handle = utils.weak_observe(value, self._observe_obj_closed, names, False, weakref.ref(obj), names)
             self._close_observers[value] = handle, names
@@ -291,7 +289,7 @@ class InstanceHPTuple(InstanceHP[V, tuple[T, ...]], Generic[V, T]):
                 obj.on_error(e, f"on_add callback for {self!r}")
 
     def _on_remove(self, obj: V, value: T):
-        if isinstance(value, HasParent | Widget) and (args := self._close_observers.pop(value, None)):
+        if isinstance(value, _HASPARENT_OR_WIDGET) and (args := self._close_observers.pop(value, None)):
             value.unobserve(*args)
         if self._hookmappings.get("close_on_remove") and hasattr(value, "close"):
             value.close()  # pyright: ignore[reportAttributeAccessIssue]
@@ -3,7 +3,6 @@ from __future__ import annotations
 from collections.abc import Callable, Iterable, Mapping
 from typing import TYPE_CHECKING, Any, Generic, Literal, ParamSpec, TypedDict, TypeVar
 
-import toolz
 from ipywidgets import Widget
 from traitlets.traitlets import HasTraits, TraitType, Unicode
 from traitlets.utils.bunch import Bunch
@@ -137,4 +136,4 @@ class NameTuple(StrTuple, Generic[R]):
         super().__init__(*menubox.utils.dottedpath(default) if default else (), **kwargs)
 
     def _iterate(self, value):
-        yield from toolz.unique(value)
+        yield from dict.fromkeys(value)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import datetime
 import functools
 import inspect
@@ -121,8 +120,10 @@ def weak_observe(
     obj.observe(handle, names=names)
 
     def disconnect(_):
-        with contextlib.suppress(Exception):
+        try:
             obj.unobserve(handle, names)
+        except Exception:
+            pass
 
     ref = weakref.WeakMethod(method, disconnect)
     return handle
@@ -184,6 +185,11 @@ async def wait_trait_value(obj: R, name: str | Callable[[R], T], predicate: Call
         await event
 
 
+@functools.lru_cache(maxsize=1024)
+def _split_dotted_name(name: str) -> tuple[str, ...]:
+    return tuple(name.split("."))
+
+
 def getattr_nested(obj, name: str, default: Any = NO_DEFAULT, *, hastrait_value=True) -> Any:
     """
     Retrieve a nested attribute from an object.
@@ -207,11 +213,11 @@ def getattr_nested(obj, name: str, default: Any = NO_DEFAULT, *, hastrait_value=
     """
 
     if "." in name:
-        a, b = name.split(".", maxsplit=1)
-        obj_ = getattr(obj, a)
-        if obj_ is None:
-            return None
-        return getattr_nested(obj_, b, default=default, hastrait_value=hastrait_value)
+        *path, name = _split_dotted_name(name)
+        for a in path:
+            obj = getattr(obj, a)
+            if obj is None:
+                return None
     try:
         val = getattr(obj, name) if default is NO_DEFAULT else getattr(obj, name, default)
         if hastrait_value and isinstance(val, traitlets.HasTraits) and val.has_trait("value"):
@@ -249,21 +255,20 @@ def setattr_nested(
             The original exception is included in the AttributeError as the cause.
             If DEBUG_ENABLED is True, the original exception is raised.
     """
-    bits = name.split(".")
-    if len(bits) > 1:
-        obj = getattr(obj, bits[0])
-        setattr_nested(obj, ".".join(bits[1:]), value, default_setter=default_setter)
-    else:
-        try:
-            setter = getattr(obj, "setter", None) or default_setter or setattr
-            setter(obj, name, value)
-        except Exception as e:
-            import menubox
+    if "." in name:
+        *path, name = _split_dotted_name(name)
+        for a in path:
+            obj = getattr(obj, a)
+    try:
+        setter = getattr(obj, "setter", None) or default_setter or setattr
+        setter(obj, name, value)
+    except Exception as e:
+        import menubox
 
-            if menubox.DEBUG_ENABLED:
-                raise
-            msg = f"Failed to set nested attribute: {fullname(obj)}.{name} = {limited_string(value)}"
-            raise AttributeError(msg) from e
+        if menubox.DEBUG_ENABLED:
+            raise
+        msg = f"Failed to set nested attribute: {fullname(obj)}.{name} = {limited_string(value)}"
+        raise AttributeError(msg) from e
 
 
 def load_nested_attrs(
@@ -325,13 +330,17 @@ def fullname(obj) -> str:
             return funcname(obj)
         if isinstance(obj, traitlets.MetaHasTraits):
             return f"{obj.__module__}.{obj.__qualname__}"
-        module = obj.__class__.__module__
-        if module is None or module == str.__class__.__module__:
-            return obj.__class__.__qualname__
+        return _fullname_of_class(obj.__class__)
     except Exception:
         return str(obj)
-    else:
-        return f"{module}.{obj.__class__.__qualname__}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _fullname_of_class(cls: type) -> str:
+    module = cls.__module__
+    if module is None or module == str.__class__.__module__:
+        return cls.__qualname__
+    return f"{module}.{cls.__qualname__}"
 
 
 def funcname(obj: Any) -> str:
@@ -361,6 +370,11 @@ def funcname(obj: Any) -> str:
         return str(obj)
 
 
+@functools.lru_cache(maxsize=1024)
+def _compile_fstr(template: str):
+    return compile(f"f''' {template} '''", "<fstr>", "eval")
+
+
 def fstr(template: str, raise_errors=False, **glbls) -> str:
     """
     Evaluate the fstring template with the mapped globals.
@@ -368,7 +382,7 @@ def fstr(template: str, raise_errors=False, **glbls) -> str:
     The template must not contain triple quote `'''`.
     """
     try:
-        return eval(f"f''' {template} '''", glbls)[1:-1]
+        return eval(_compile_fstr(template), glbls)[1:-1]
     except Exception as e:
         if template.find("'''") >= 0:
             template = template.replace("'''", '"""')
@@ -45,6 +45,16 @@ class HP(mhp.HasParent):
         self.caught_errors += 1
 
 
+class HPCoerce(mhp.HasParent):
+    raw = traitlets.Any(0)
+    value = traitlets.CInt(0)
+
+
+class HPButtons(mhp.HasParent):
+    b1 = TF.Button(cast("Self", 0)).hooks(on_replace_close=False)
+    b2 = TF.Button(cast("Self", 0)).hooks(on_replace_close=False)
+
+
 class TestHasParent:
     async def test_has_parent_setup(self):
         hp = HP()
@@ -124,6 +134,21 @@ class TestHasParent:
         assert parent.a_link2.value != hp.a_link2.value
         assert parent.a_dlink2.value != hp.a_dlink2.value
 
+    async def test_has_parent_batch_links(self):
+        hp = HP()
+        parent = HP(a_link=2, a_dlink=4)
+        with hp.batch_links():
+            hp.parent = parent
+            hp.parent_link = ("a_link",)
+            hp.parent_dlink = ("a_dlink",)
+            assert not hp._hp_reg_parent_link, "Links should be deferred"
+            assert hp.a_link == 0
+        assert len(hp._hp_reg_parent_link) == 1
+        assert len(hp._hp_reg_parent_dlink) == 1
+        assert hp.a_link == 2
+        assert hp.a_dlink == 4
+        hp.close()
+
     async def test_hasparent_linking_equality(self):
         # Linking checks for equality.
         # Dataframes need special consideration
@@ -188,6 +213,118 @@ class TestHasParent:
         assert len(hps._hasparent_all_links) == 6
         hps.close()
 
+    async def test_hasparent_link_reuse(self):
+        parent = HP(a_link=2)
+        hp = HP()
+        hp.link((parent, "a_link"), (hp, "a_dlink"))
+        link = hp._hasparent_all_links[("link", (hp, "a_dlink"))]
+
+        changes = []
+        hp.observe(changes.append, names="a_dlink")
+        hp.link((parent, "a_link"), (hp, "a_dlink"))
+        assert hp._hasparent_all_links[("link", (hp, "a_dlink"))] is link, "Equivalent link should be reused"
+        assert not link.closed
+        assert not changes, "Re-syncing an unchanged target should not notify observers"
+
+        hp.link((parent, "a_link"), (hp, "a_dlink"), transform=(float, int))
+        assert hp._hasparent_all_links[("link", (hp, "a_dlink"))] is not link
+        assert link.closed
+        hp.close()
+
+        hp2 = HP()
+        hp2.dlink((parent, "a_link"), (hp2, "a_dlink"))
+        dlink = hp2._hasparent_all_links[("dlink", (hp2, "a_dlink"))]
+        hp2.a_dlink = 99
+        assert parent.a_link != hp2.a_dlink
+        hp2.dlink((parent, "a_link"), (hp2, "a_dlink"))
+        assert hp2._hasparent_all_links[("dlink", (hp2, "a_dlink"))] is dlink, "Equivalent dlink should be reused"
+        assert hp2.a_dlink == parent.a_link, "Reused dlink should re-sync a diverged target"
+        hp2.close()
+
+    async def test_hasparent_link_unchanged_target(self):
+        parent = HP(a_link=2)
+        hp = HP()
+        hp.dlink((parent, "a_link"), (hp, "a_dlink"), transform=abs)
+        changes = []
+        hp.observe(changes.append, names="a_dlink")
+        parent.a_link = -2
+        assert hp.a_dlink == 2
+        assert not changes, "An unchanged target should not be notified"
+        parent.a_link = -3
+        assert hp.a_dlink == 3
+        assert len(changes) == 1
+        assert not hp.caught_errors
+        hp.close()
+
+    async def test_hasparent_link_coercing_target(self):
+        hpc = HPCoerce()
+        hpc.dlink((hpc, "raw"), (hpc, "value"))
+        changes = []
+        hpc.observe(changes.append, names="value")
+        hpc.raw = "3"
+        assert hpc.value == 3, "The target trait should coerce the value"
+        assert len(changes) == 1
+        hpc.raw = 3.0
+        assert hpc.value == 3
+        assert len(changes) == 1, "The coerced value is unchanged so no notification is expected"
+
+        hpc.raw = 4
+        hp = HP()
+        hp.dlink((hpc, "raw"), (hp, "a_link"))
+        assert hp.a_link == 4
+        hp.a_link = 3
+        hpc.raw = 3.0
+        assert hp.caught_errors == 1, "An equal value must still be validated by the target trait"
+        assert hp.a_link == 3
+        hpc.close()
+        hp.close()
+
+    async def test_hasparent_button_register(self):
+        hp = HPButtons()
+        b = hp.b1
+        hp.set_trait("b2", b)
+        assert set(hp._button_register[b]) == {"b1", "b2"}
+        assert len(b._click_handlers.callbacks) == 2
+
+        hp.set_trait("b1", ipw.Button())
+        assert set(hp._button_register[b]) == {"b2"}
+        assert len(b._click_handlers.callbacks) == 1, "Only the callback for 'b1' should be removed"
+
+        hp.set_trait("b2", ipw.Button())
+        assert b not in hp._button_register
+        assert not b._click_handlers.callbacks
+        hp.close()
+
+    async def test_hasparent_notifier_cache(self):
+        hp = HP()
+        calls, calls2 = [], []
+
+        def handler(change):
+            calls.append(change["new"])
+
+        def handler2(change):
+            calls2.append(change["new"])
+
+        hp.a_link = 1
+        hp.observe(handler, "a_link")
+        hp.a_link = 2
+        assert calls == [2]
+
+        hp.observe(handler2, "a_link")
+        hp.a_link = 3
+        assert calls == [2, 3]
+        assert calls2 == [3], "Observers added after dispatch should be called"
+
+        hp.unobserve(handler, "a_link")
+        hp.a_link = 4
+        assert calls == [2, 3], "Removed observers should not be called"
+        assert calls2 == [3, 4]
+
+        hp.unobserve_all("a_link")
+        hp.a_link = 5
+        assert calls2 == [3, 4], "unobserve_all should remove all observers"
+        hp.close()
+
     async def test_hasparent_link_lambda(self):
         hp = HP()
         parent = HP(a_link=2, a_dlink=4)
@@ -223,6 +360,26 @@ class TestHasParent:
 
         assert hp.caught_errors == 1
 
+    async def test_hasparent_parent_closed_errors(self):
+        class HPCloseFails(HP):
+            fail_before_close = True
+
+            @override
+            def close(self, force=False):
+                if self.fail_before_close:
+                    raise ValueError(match)
+                super().close(force)
+                raise ValueError(match)
+
+        hp = HPCloseFails()
+        with pytest.raises(ValueError, match=match):
+            hp._hp_parent_closed()
+        assert not hp.closed, "A genuine close failure should be reported"
+
+        hp.fail_before_close = False
+        hp._hp_parent_closed()
+        assert hp.closed, "A failure after closing should not be reported"
+
     async def test_hasparent_cleanup_exceptions(self):
         hp = HP()
 
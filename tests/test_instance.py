@@ -177,6 +177,42 @@ class TestInstance:
         assert hpi4.value_changed["new"] is new
         assert hpi4.value_changed["old"] is old
 
+    async def test_instance_register_change_hook(self, home: mb.Home):
+        class HPI5(HasHome):
+            hpi = TF.InstanceHP(HPI).configure(TF.IHPMode.XLRN).hooks(test_hook=True)  # pyright: ignore[reportCallIssue]
+
+        hpi5 = HPI5(home=home)
+        assert hpi5.hpi
+        calls = []
+        InstanceHP.register_change_hook("test_hook", calls.append)
+        try:
+            new = HPI()
+            hpi5.set_trait("hpi", new)
+            assert len(calls) == 1, "Hooks registered after first use should be called"
+            assert calls[0]["new"] is new
+        finally:
+            assert InstanceHP.unregister_change_hook("test_hook") == calls.append
+        hpi5.set_trait("hpi", HPI())
+        assert len(calls) == 1, "Unregistered hooks should not be called"
+
+    async def test_instance_subclass_validate(self):
+        validated = []
+
+        class ValidatingInstanceHP(InstanceHP):
+            def _validate(self, obj, value):
+                validated.append(self.name)
+                return super()._validate(obj, value)
+
+        class HPI6(HasParent):
+            hpi = ValidatingInstanceHP(HPI).configure(TF.IHPMode.XLRN)
+            hpi_none = ValidatingInstanceHP(HPI, default=lambda _: None).configure(TF.IHPMode.XLRN)
+
+        hpi6 = HPI6()
+        assert isinstance(hpi6.hpi, HPI)
+        assert hpi6.hpi_none is None
+        assert validated == ["hpi", "hpi_none"], "A subclass _validate should not be bypassed"
+        hpi6.close()
+
     @pytest.mark.parametrize("trait", ["box", "menubox", "hpi2"])
     async def test_instance_gc(self, trait, weakref_enabled):
         """